@@ -56,3 +56,59 @@ def test_cli_missing_file_returns_error(capsys: pytest.CaptureFixture[str]) -> N
 	assert exit_code == 1
 	assert "does-not-exist" in captured.err
 
+
+def test_cli_accepts_options_before_guest_list(
+	sample_guest_csv: Path,
+	capsys: pytest.CaptureFixture[str],
+) -> None:
+	exit_code = main(["--table-size", "2", str(sample_guest_csv)])
+	captured = capsys.readouterr()
+
+	assert exit_code == 0
+	assert captured.out.strip().splitlines() == [
+		"Table 1: Alice, Bob",
+		"Table 2: Carol",
+	]
+
+
+def test_cli_sweep_prints_comparison_table(
+	sample_guest_csv: Path,
+	capsys: pytest.CaptureFixture[str],
+) -> None:
+	exit_code = main(
+		[
+			str(sample_guest_csv),
+			"--sweep",
+			"--table-size",
+			"2",
+			"--table-size",
+			"3",
+			"--max-iter",
+			"5",
+			"--workers",
+			"1",
+		]
+	)
+	captured = capsys.readouterr()
+	lines = captured.out.strip().splitlines()
+
+	assert exit_code == 0
+	assert lines[0].split() == ["table_size", "vip_tables", "max_iter", "objective", "tables", "runtime_s"]
+	assert len(lines) == 3
+
+
+def test_cli_sweep_rejects_no_print(sample_guest_csv: Path) -> None:
+	with pytest.raises(SystemExit):
+		main([str(sample_guest_csv), "--sweep", "--no-print"])
+
+
+@pytest.mark.parametrize(
+	"extra_args",
+	[
+		["--table-size", "2", "--table-size", "3"],
+		["--workers", "2"],
+	],
+)
+def test_cli_grid_flags_require_sweep(sample_guest_csv: Path, extra_args: list[str]) -> None:
+	with pytest.raises(SystemExit):
+		main([str(sample_guest_csv), *extra_args, "--no-print"])
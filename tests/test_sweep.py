@@ -0,0 +1,120 @@
+import importlib
+from concurrent.futures.process import BrokenProcessPool
+from typing import List
+
+import pytest
+
+from wedding_seating.core import GuestIndex, WeddingSeating
+from wedding_seating.sweep import SWEEP_COLUMNS, sweep
+from wedding_seating.types import Guest, Tables
+
+# The package re-exports the sweep() function under the same name as its module.
+sweep_module = importlib.import_module("wedding_seating.sweep")
+
+
+@pytest.fixture
+def guest_list() -> List[Guest]:
+    return [
+        {"name": "Alice", "group": None, "vip": True, "avoid": [], "friends": ["Bob"]},
+        {"name": "Bob", "group": None, "vip": False, "avoid": [], "friends": ["Alice"]},
+        {"name": "Carol", "group": "Family1", "vip": False, "avoid": [], "friends": []},
+        {"name": "Dave", "group": "Family1", "vip": False, "avoid": ["Eve"], "friends": []},
+        {"name": "Eve", "group": None, "vip": False, "avoid": [], "friends": []},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("table_size", "expected_tables", "expected_objective"),
+    [
+        # Expected layouts captured from the optimizer before GuestIndex was introduced.
+        (2, [["Alice", "Bob"], ["Carol", "Dave"], ["Eve"]], 12),
+        (3, [["Eve", "Alice", "Bob"], ["Dave", "Carol"]], 12),
+        (5, [["Alice", "Carol", "Dave", "Bob", "Eve"]], -88),
+    ],
+)
+def test_shared_index_reproduces_known_layouts(
+    guest_list: List[Guest],
+    table_size: int,
+    expected_tables: List[List[str]],
+    expected_objective: int,
+) -> None:
+    index = GuestIndex(guest_list)
+
+    for planner in (
+        WeddingSeating.from_index(index, table_size=table_size, vip_tables=1, max_iter=20),
+        WeddingSeating(guest_list, table_size=table_size, vip_tables=1, max_iter=20),
+    ):
+        tables = planner.optimize()
+        assert [[guest["name"] for guest in table] for table in tables] == expected_tables
+        assert planner.objective() == expected_objective
+
+
+def test_guest_index_skips_duplicate_and_unknown_guests(guest_list: List[Guest]) -> None:
+    twins: List[Guest] = [
+        {"name": "Sam", "group": None, "vip": False, "avoid": ["Alice"], "friends": []},
+        {"name": "Sam", "group": None, "vip": False, "avoid": [], "friends": ["Alice"]},
+    ]
+    index = GuestIndex(guest_list + twins)
+
+    assert index.relationship_weights(guest_list[0]) == {"Bob": 5}
+    assert index.relationship_weights(guest_list[3]) == {"Eve": -100}
+    assert index.relationship_weights(twins[0]) is None
+    assert index.relationship_weights(dict(guest_list[0])) is None  # type: ignore[arg-type]
+
+    planner = WeddingSeating.from_index(index, table_size=3)
+    alice_table = [guest_list[0]]
+    assert planner._table_score(alice_table, twins[0]) == -100
+    assert planner._table_score(alice_table, twins[1]) == 5
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_sweep_returns_row_per_scenario(guest_list: List[Guest], max_workers: int) -> None:
+    results = sweep(
+        guest_list,
+        table_sizes=[2, 3],
+        vip_tables=[1],
+        max_iters=[5, 20],
+        max_workers=max_workers,
+    )
+
+    assert list(results.columns) == SWEEP_COLUMNS
+    assert len(results) == 4
+    assert list(zip(results["table_size"], results["max_iter"])) == [(2, 5), (2, 20), (3, 5), (3, 20)]
+    assert list(results["tables"]) == [3, 3, 2, 2]
+    assert (results["runtime_s"] >= 0).all()
+
+    assert results["objective"].iloc[3] == 12
+
+
+def test_sweep_error_names_failing_scenario(guest_list: List[Guest], monkeypatch: pytest.MonkeyPatch) -> None:
+    original_optimize = WeddingSeating.optimize
+
+    def failing_optimize(self: WeddingSeating) -> Tables:
+        if self.table_size == 3:
+            raise ValueError("boom")
+        return original_optimize(self)
+
+    monkeypatch.setattr(WeddingSeating, "optimize", failing_optimize)
+
+    with pytest.raises(RuntimeError, match=r"table_size=3, vip_tables=1, max_iter=5.*boom"):
+        sweep(guest_list, table_sizes=[2, 3], max_iters=[5], max_workers=1)
+
+
+def test_sweep_wraps_worker_pool_failures(guest_list: List[Guest], monkeypatch: pytest.MonkeyPatch) -> None:
+    class BrokenExecutor:
+        def __init__(self, **kwargs: object) -> None:
+            pass
+
+        def __enter__(self) -> "BrokenExecutor":
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            return None
+
+        def map(self, *args: object) -> List[object]:
+            raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(sweep_module, "ProcessPoolExecutor", BrokenExecutor)
+
+    with pytest.raises(RuntimeError, match="Sweep worker pool failed.*worker died"):
+        sweep(guest_list, table_sizes=[2, 3], max_workers=2)
@@ -1,14 +1,17 @@
 """Wedding seating planner package."""
 
-from .core import WeddingSeating
+from .core import GuestIndex, WeddingSeating
+from .sweep import sweep
 from .utils import import_guest_list_csv, save_csv, save_pdf
 
 __version__ = "0.2.0"
 
 __all__ = [
+    "GuestIndex",
     "WeddingSeating",
     "import_guest_list_csv",
     "save_csv",
     "save_pdf",
+    "sweep",
     "__version__",
 ]
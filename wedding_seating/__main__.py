@@ -1,10 +1,13 @@
 import argparse
 import sys
-from typing import Iterable, Iterator, Optional
+from typing import Iterable, Iterator, Optional, TypeVar
 
 from .core import WeddingSeating
+from .sweep import sweep
 from .utils import import_guest_list_csv
 
+T = TypeVar("T")
+
 
 def _positive_int(value: str) -> int:
     try:
@@ -28,20 +31,20 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--table-size",
         type=_positive_int,
-        default=8,
-        help="Maximum number of guests per table (default: 8).",
+        action="append",
+        help="Maximum number of guests per table (default: 8). Repeat the flag with --sweep to compare several values.",
     )
     parser.add_argument(
         "--vip-tables",
         type=_positive_int,
-        default=1,
-        help="Number of tables reserved for VIP guests (default: 1).",
+        action="append",
+        help="Number of tables reserved for VIP guests (default: 1). Repeat the flag with --sweep to compare several values.",
     )
     parser.add_argument(
         "--max-iter",
         type=_positive_int,
-        default=100,
-        help="Maximum iterations for local optimization swaps (default: 100).",
+        action="append",
+        help="Maximum iterations for local optimization swaps (default: 100). Repeat the flag with --sweep to compare several values.",
     )
     parser.add_argument(
         "--export-prefix",
@@ -56,6 +59,19 @@ def _build_parser() -> argparse.ArgumentParser:
             "to write multiple formats (default: csv)."
         ),
     )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help=(
+            "Optimize every combination of --table-size, --vip-tables and --max-iter "
+            "values and print a comparison table instead of a seating chart."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        help="Number of worker processes used by --sweep (default: CPU count).",
+    )
     parser.add_argument(
         "--no-print",
         action="store_true",
@@ -64,8 +80,8 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _unique_ordered(values: Iterable[str]) -> Iterator[str]:
-    seen: set[str] = set()
+def _unique_ordered(values: Iterable[T]) -> Iterator[T]:
+    seen: set[T] = set()
     for value in values:
         if value not in seen:
             seen.add(value)
@@ -76,6 +92,26 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(list(argv) if argv is not None else None)
 
+    if args.sweep:
+        if args.export_prefix:
+            parser.error("--export-prefix cannot be combined with --sweep")
+        if args.no_print:
+            parser.error("--no-print cannot be combined with --sweep")
+    else:
+        for flag, values in (
+            ("--table-size", args.table_size),
+            ("--vip-tables", args.vip_tables),
+            ("--max-iter", args.max_iter),
+        ):
+            if values is not None and len(values) > 1:
+                parser.error(f"{flag} can only be given more than once with --sweep")
+        if args.workers is not None:
+            parser.error("--workers requires --sweep")
+
+    table_sizes = args.table_size or [8]
+    vip_tables = args.vip_tables or [1]
+    max_iters = args.max_iter or [100]
+
     try:
         guest_list = import_guest_list_csv(args.guest_list)
     except FileNotFoundError:
@@ -89,11 +125,26 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         print("Error: guest list CSV did not contain any guests.", file=sys.stderr)
         return 1
 
+    if args.sweep:
+        try:
+            results = sweep(
+                guest_list,
+                table_sizes=list(_unique_ordered(table_sizes)),
+                vip_tables=list(_unique_ordered(vip_tables)),
+                max_iters=list(_unique_ordered(max_iters)),
+                max_workers=args.workers,
+            )
+        except RuntimeError as exc:
+            print(f"Error running sweep: {exc}", file=sys.stderr)
+            return 1
+        print(results.to_string(index=False))
+        return 0
+
     planner = WeddingSeating(
         guest_list,
-        table_size=args.table_size,
-        vip_tables=args.vip_tables,
-        max_iter=args.max_iter,
+        table_size=table_sizes[0],
+        vip_tables=vip_tables[0],
+        max_iter=max_iters[0],
     )
 
     tables = planner.optimize()
@@ -5,6 +5,55 @@ from typing import Dict, Iterable, List, Optional, Set
 from .types import Guest, Table, Tables
 from .utils import save_csv, save_pdf
 
+
+class GuestIndex:
+    def __init__(self, guest_list: Iterable[Guest]) -> None:
+        """
+        Precomputed VIP/group partitions and relationship weights that do
+        not depend on table settings. Build once and share across
+        WeddingSeating.from_index planners to skip re-deriving them for
+        every scenario.
+        """
+        self.guest_list: List[Guest] = list(guest_list)
+        self.vip_guests: List[Guest] = [guest for guest in self.guest_list if guest.get('vip')]
+        self.non_vip_guests: List[Guest] = [guest for guest in self.guest_list if not guest.get('vip')]
+
+        self.groups: Dict[str, List[Guest]] = {}
+        for guest in self.non_vip_guests:
+            group = guest.get('group')
+            if group:
+                existing = self.groups.get(group)
+                if existing is None:
+                    self.groups[group] = [guest]
+                else:
+                    existing.append(guest)
+
+        # Avoid/friend weights per seatmate name, only for uniquely named
+        # guests; anyone else is scored from their own guest dict.
+        name_counts: Dict[str, int] = {}
+        for guest in self.guest_list:
+            name_counts[guest['name']] = name_counts.get(guest['name'], 0) + 1
+        self._owners: Dict[str, Guest] = {}
+        self.relationships: Dict[str, Dict[str, int]] = {}
+        for guest in self.guest_list:
+            name = guest['name']
+            if name_counts[name] > 1:
+                continue
+            weights: Dict[str, int] = {}
+            for avoid in guest.get('avoid', []):
+                weights[avoid] = weights.get(avoid, 0) - 100
+            for friend in guest.get('friends', []):
+                weights[friend] = weights.get(friend, 0) + 5
+            self._owners[name] = guest
+            self.relationships[name] = weights
+
+    def relationship_weights(self, guest: Guest) -> Optional[Dict[str, int]]:
+        """Seatmate weights for an indexed guest, or None if not indexed."""
+        if self._owners.get(guest['name']) is not guest:
+            return None
+        return self.relationships[guest['name']]
+
+
 class WeddingSeating:
     def __init__(
         self,
@@ -20,20 +69,35 @@ class WeddingSeating:
         vip_tables: number of tables reserved for VIPs
         max_iter: max iterations for local optimization
         """
-        self.guest_list: List[Guest] = list(guest_list)
+        self.index: GuestIndex = GuestIndex(guest_list)
+        self.guest_list: List[Guest] = self.index.guest_list
         self.table_size: int = table_size
         self.vip_tables: int = vip_tables
         self.max_iter: int = max_iter
         self.tables: Tables = []
 
+    @classmethod
+    def from_index(
+        cls,
+        index: GuestIndex,
+        table_size: int = 8,
+        vip_tables: int = 1,
+        max_iter: int = 100,
+    ) -> WeddingSeating:
+        """Build a planner that reuses an existing GuestIndex and its guests."""
+        planner = cls([], table_size=table_size, vip_tables=vip_tables, max_iter=max_iter)
+        planner.index = index
+        planner.guest_list = index.guest_list
+        return planner
+
     def optimize(self) -> Tables:
         n_guests = len(self.guest_list)
         n_tables = (n_guests + self.table_size - 1) // self.table_size
         self.tables = [[] for _ in range(n_tables)]
 
         # --- Step 1: Place VIPs ---
-        vip_guests = [guest for guest in self.guest_list if guest.get('vip')]
-        non_vip_guests = [guest for guest in self.guest_list if not guest.get('vip')]
+        vip_guests = self.index.vip_guests
+        non_vip_guests = self.index.non_vip_guests
 
         table_idx = 0
         for guest in vip_guests:
@@ -44,18 +108,8 @@ class WeddingSeating:
                 table_idx = 0  # VIPs distributed among VIP tables
 
         # --- Step 2: Place groups/families ---
-        groups: Dict[str, List[Guest]] = {}
-        for guest in non_vip_guests:
-            group = guest.get('group')
-            if group:
-                existing = groups.get(group)
-                if existing is None:
-                    groups[group] = [guest]
-                else:
-                    existing.append(guest)
-
         placed_guests: Set[str] = set()
-        for group_guests in groups.values():
+        for group_guests in self.index.groups.values():
             # Find table with enough space
             table_idx = self._find_table_for_group(len(group_guests))
             if table_idx is not None:
@@ -77,6 +131,14 @@ class WeddingSeating:
 
         return self.tables
 
+    def objective(self) -> int:
+        """Total seating score of the current tables (higher is better)."""
+        total = 0
+        for table in self.tables:
+            for idx, guest in enumerate(table):
+                total += self._table_score(table[:idx] + table[idx + 1:], guest)
+        return total
+
     # --- Helper methods ---
     def _find_table_for_group(self, group_size: int) -> Optional[int]:
         for idx, table in enumerate(self.tables):
@@ -102,15 +164,21 @@ class WeddingSeating:
 
     def _table_score(self, table: Table, guest: Guest) -> int:
         score = 0
-        table_names = [g['name'] for g in table]
-        # Avoid conflicts
-        for avoid in guest.get('avoid', []):
-            if avoid in table_names:
-                score -= 100
-        # Friend bonus
-        for friend in guest.get('friends', []):
-            if friend in table_names:
-                score += 5
+        weights = self.index.relationship_weights(guest)
+        if weights is None:
+            table_names = {g['name'] for g in table}
+            # Avoid conflicts
+            for avoid in guest.get('avoid', []):
+                if avoid in table_names:
+                    score -= 100
+            # Friend bonus
+            for friend in guest.get('friends', []):
+                if friend in table_names:
+                    score += 5
+        elif weights:
+            # Avoid conflicts and friend bonus, precomputed per seatmate name
+            table_names = {g['name'] for g in table}
+            score += sum(weight for name, weight in weights.items() if name in table_names)
         # Group bonus
         if guest.get('group'):
             group_count = sum(1 for g in table if g.get('group') == guest.get('group'))
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import product
+from typing import Iterable, List, Optional, Sequence, Tuple, TypedDict
+
+import pandas as pd
+
+from .core import GuestIndex, WeddingSeating
+from .types import Guest
+
+Scenario = Tuple[int, int, int]
+
+SWEEP_COLUMNS = ['table_size', 'vip_tables', 'max_iter', 'objective', 'tables', 'runtime_s']
+
+
+class SweepResult(TypedDict):
+    table_size: int
+    vip_tables: int
+    max_iter: int
+    objective: int
+    tables: int
+    runtime_s: float
+
+
+_worker_index: Optional[GuestIndex] = None
+
+
+def _init_worker(index: GuestIndex) -> None:
+    global _worker_index
+    _worker_index = index
+
+
+def _evaluate(index: GuestIndex, scenario: Scenario) -> SweepResult:
+    table_size, vip_tables, max_iter = scenario
+    try:
+        start = time.perf_counter()
+        planner = WeddingSeating.from_index(
+            index,
+            table_size=table_size,
+            vip_tables=vip_tables,
+            max_iter=max_iter,
+        )
+        tables = planner.optimize()
+        runtime = time.perf_counter() - start
+        objective = planner.objective()
+    except Exception as exc:
+        raise RuntimeError(
+            f"Scenario (table_size={table_size}, vip_tables={vip_tables}, "
+            f"max_iter={max_iter}) failed: {exc!r}"
+        ) from exc
+    return {
+        'table_size': table_size,
+        'vip_tables': vip_tables,
+        'max_iter': max_iter,
+        'objective': objective,
+        'tables': len(tables),
+        'runtime_s': runtime,
+    }
+
+
+def _evaluate_in_worker(scenario: Scenario) -> SweepResult:
+    assert _worker_index is not None
+    return _evaluate(_worker_index, scenario)
+
+
+def sweep(
+    guest_list: Iterable[Guest],
+    table_sizes: Sequence[int] = (8,),
+    vip_tables: Sequence[int] = (1,),
+    max_iters: Sequence[int] = (100,),
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Optimize every combination of table_sizes x vip_tables x max_iters.
+
+    The guest index (VIP/group partitions and relationship weights) is
+    built once and shared with the worker processes.
+    max_workers: process count (None uses all CPUs, 1 runs in-process),
+        never more than the number of scenarios
+    Raises RuntimeError naming the scenario if any grid point fails, or
+    if the worker pool breaks or cannot pickle its inputs.
+    Returns one row per scenario with the columns in SWEEP_COLUMNS.
+    """
+    index = GuestIndex(guest_list)
+    scenarios: List[Scenario] = list(product(table_sizes, vip_tables, max_iters))
+
+    workers = min(max_workers or os.cpu_count() or 1, len(scenarios))
+
+    if workers <= 1:
+        results = [_evaluate(index, scenario) for scenario in scenarios]
+    else:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(index,),
+            ) as executor:
+                results = list(executor.map(_evaluate_in_worker, scenarios))
+        except (BrokenProcessPool, pickle.PicklingError) as exc:
+            raise RuntimeError(f"Sweep worker pool failed: {exc!r}") from exc
+
+    return pd.DataFrame(results, columns=SWEEP_COLUMNS)